@@ -29,6 +29,7 @@ from ._roodatahist import RooDataHist
 from ._roodataset import RooDataSet
 from ._roodecays import RooDecay, RooBDecay, RooBCPGenDecay, RooBCPEffDecay, RooBMixDecay
 from ._roogenfitstudy import RooGenFitStudy
+from . import _rooglobalfunc
 from ._rooglobalfunc import (
     DataError,
     FitOptions,
@@ -250,6 +251,10 @@ def pythonize_roofit_class(klass, name):
 
 def pythonize_roofit_namespace(ns):
 
+    # Bind the namespace once, such that the wrappers can directly call the
+    # original functions without looking up the namespace each time.
+    _rooglobalfunc._RooFit = ns
+
     for python_func in python_roofit_functions:
         func_name = python_func.__name__
         func_name_orig = "_" + func_name
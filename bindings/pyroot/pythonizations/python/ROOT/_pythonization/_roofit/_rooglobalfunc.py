@@ -37,8 +37,16 @@ ROOT.RooMCStudy(model, ROOT.RooArgSet(x), FitOptions=dict(Save=True, PrintEvalEr
 */
 """
 
+import re
+
 from ._utils import _kwargs_to_roocmdargs, _string_to_root_attribute, _dict_to_std_map, cpp_signature
 
+# The RooFit namespace from cppyy, which holds the original C++ functions that
+# are wrapped by the pythonizations in this file. It is bound by
+# pythonize_roofit_namespace() when the namespace gets pythonized, so the
+# wrappers don't need to go through the import machinery on every call.
+_RooFit = None
+
 
 # Color and Style dictionary to define matplotlib conventions
 _color_map = {
@@ -53,6 +61,29 @@ _color_map = {
 }
 _style_map = {"-": "kSolid", "--": "kDashed", ":": "kDotted", "-.": "kDashDotted"}
 
+# Caches for the values that string arguments of the color and style functions
+# resolve to. Only the keys of the lookup maps and plain enum value names with
+# an optional offset, like "kRed" or "kRed+1", are cached. Any other string is
+# evaluated as an expression by _string_to_root_attribute(), and its value can
+# change between calls, e.g. "TColor.GetColorPalette(3)".
+_resolved_color_map = {}
+_resolved_style_map = {}
+_resolved_attribute_map = {}
+_cacheable_attribute_re = re.compile(r"k\w+(\s*[+-]\s*\d+)?\Z")
+
+
+def _resolve_root_attribute(value, lookup_map, resolved_map):
+    """Cached version of _string_to_root_attribute()."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return resolved_map[value]
+    except KeyError:
+        resolved = _string_to_root_attribute(value, lookup_map)
+        if value in lookup_map or _cacheable_attribute_re.match(value):
+            resolved_map[value] = resolved
+        return resolved
+
 
 @cpp_signature(
     "RooFit::FitOptions(const RooCmdArg& arg1, const RooCmdArg& arg2=RooCmdArg::none(),"
@@ -64,10 +95,10 @@ def FitOptions(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `FitOptions` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._FitOptions(*args)
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._FitOptions(*args, **kwargs)
+    return _RooFit._FitOptions(*args, **kwargs)
 
 
 @cpp_signature(
@@ -81,13 +112,13 @@ def Format(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `Format` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._Format(*args)
     if "what" in kwargs:
         args = (kwargs["what"],) + args
         del kwargs["what"]
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._Format(*args, **kwargs)
+    return _RooFit._Format(*args, **kwargs)
 
 
 @cpp_signature(
@@ -100,10 +131,10 @@ def Frame(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `Frame` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._Frame(*args)
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._Frame(*args, **kwargs)
+    return _RooFit._Frame(*args, **kwargs)
 
 
 @cpp_signature(
@@ -117,10 +148,10 @@ def MultiArg(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `MultiArg` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._MultiArg(*args)
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._MultiArg(*args, **kwargs)
+    return _RooFit._MultiArg(*args, **kwargs)
 
 
 @cpp_signature("RooFit::YVar(const RooAbsRealLValue& var, const RooCmdArg& arg=RooCmdArg::none()) ;")
@@ -129,13 +160,13 @@ def YVar(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `YVar` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._YVar(*args)
     if "var" in kwargs:
         args = (kwargs["var"],) + args
         del kwargs["var"]
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._YVar(*args, **kwargs)
+    return _RooFit._YVar(*args, **kwargs)
 
 
 @cpp_signature("RooFit::ZVar(const RooAbsRealLValue& var, const RooCmdArg& arg=RooCmdArg::none()) ;")
@@ -144,13 +175,13 @@ def ZVar(*args, **kwargs):
     The keywords must correspond to the CmdArg of the function.
     """
     # Redefinition of `ZVar` for keyword arguments.
-    from cppyy.gbl import RooFit
-
+    if not kwargs:
+        return _RooFit._ZVar(*args)
     if "var" in kwargs:
         args = (kwargs["var"],) + args
         del kwargs["var"]
     args, kwargs = _kwargs_to_roocmdargs(*args, **kwargs)
-    return RooFit._ZVar(*args, **kwargs)
+    return _RooFit._ZVar(*args, **kwargs)
 
 
 @cpp_signature("RooFit::Slice(std::map<RooCategory*, std::string> const&) ;")
@@ -160,14 +191,11 @@ def Slice(*args, **kwargs):
     The instances in the dict must correspond to the template argument in std::map of the function.
     """
     # Redefinition of `Slice` for keyword arguments and converting python dict to std::map.
-    from cppyy.gbl import RooFit
+    if not kwargs and len(args) == 1 and isinstance(args[0], dict):
+        arg_map = _dict_to_std_map(args[0], {"RooCategory*": "std::string"})
+        return _RooFit._Slice(arg_map)
 
-    if len(args) == 1 and len(kwargs) == 0 and isinstance(args[0], dict):
-        args = list(args)
-        args[0] = _dict_to_std_map(args[0], {"RooCategory*": "std::string"})
-        return RooFit._Slice(args[0])
-
-    return RooFit._Slice(*args, **kwargs)
+    return _RooFit._Slice(*args, **kwargs)
 
 
 @cpp_signature(
@@ -183,14 +211,11 @@ def Import(*args, **kwargs):
     The instances in the dict must correspond to the template argument in std::map of the function.
     """
     # Redefinition of `Import` for keyword arguments and converting python dict to std::map.
-    from cppyy.gbl import RooFit
-
-    if len(args) == 1 and len(kwargs) == 0 and isinstance(args[0], dict):
-        args = list(args)
-        args[0] = _dict_to_std_map(args[0], {"std::string": ["TH1*", "RooDataHist*", "RooDataSet*"]})
-        return RooFit._Import(args[0])
+    if not kwargs and len(args) == 1 and isinstance(args[0], dict):
+        arg_map = _dict_to_std_map(args[0], {"std::string": ["TH1*", "RooDataHist*", "RooDataSet*"]})
+        return _RooFit._Import(arg_map)
 
-    return RooFit._Import(*args, **kwargs)
+    return _RooFit._Import(*args, **kwargs)
 
 
 @cpp_signature("RooFit::Link(const std::map<std::string,RooAbsData*>&) ;")
@@ -200,14 +225,11 @@ def Link(*args, **kwargs):
     The instances in the dict must correspond to the template argument in std::map of the function.
     """
     # Redefinition of `Link` for keyword arguments and converting python dict to std::map.
-    from cppyy.gbl import RooFit
+    if not kwargs and len(args) == 1 and isinstance(args[0], dict):
+        arg_map = _dict_to_std_map(args[0], {"std::string": "RooAbsData*"})
+        return _RooFit._Import(arg_map)
 
-    if len(args) == 1 and len(kwargs) == 0 and isinstance(args[0], dict):
-        args = list(args)
-        args[0] = _dict_to_std_map(args[0], {"std::string": "RooAbsData*"})
-        return RooFit._Import(args[0])
-
-    return RooFit._Link(*args, **kwargs)
+    return _RooFit._Link(*args, **kwargs)
 
 
 @cpp_signature("RooFit::LineColor(Color_t color) ;")
@@ -228,17 +250,13 @@ def LineColor(color):
     pdf.plotOn(frame, LineColor="kRed+1")
     ~~~
     """
-    from cppyy.gbl import RooFit
-
-    return RooFit._LineColor(_string_to_root_attribute(color, _color_map))
+    return _RooFit._LineColor(_resolve_root_attribute(color, _color_map, _resolved_color_map))
 
 
 @cpp_signature("RooFit::FillColor(Color_t color) ;")
 def FillColor(color):
     # Redefinition of `FillColor` for matplotlib conventions and string arguments.
-    from cppyy.gbl import RooFit
-
-    return RooFit._FillColor(_string_to_root_attribute(color, _color_map))
+    return _RooFit._FillColor(_resolve_root_attribute(color, _color_map, _resolved_color_map))
 
 # Copy the docstring from LineColor.
 FillColor.__doc__ = LineColor.__doc__
@@ -247,9 +265,7 @@ FillColor.__doc__ = LineColor.__doc__
 @cpp_signature("RooFit::MarkerColor(Color_t color) ;")
 def MarkerColor(color):
     # Redefinition of `MarkerColor` for matplotlib conventions and string arguments.
-    from cppyy.gbl import RooFit
-
-    return RooFit._MarkerColor(_string_to_root_attribute(color, _color_map))
+    return _RooFit._MarkerColor(_resolve_root_attribute(color, _color_map, _resolved_color_map))
 
 # Copy the docstring from LineColor.
 MarkerColor.__doc__ = LineColor.__doc__
@@ -258,25 +274,24 @@ MarkerColor.__doc__ = LineColor.__doc__
 @cpp_signature("RooFit::LineStyle(Style_t style) ;")
 def LineStyle(style):
     # Redefinition of `LineStyle` for matplotlib conventions and string arguments.
-    from cppyy.gbl import RooFit
-
-    return RooFit._LineStyle(_string_to_root_attribute(style, _style_map))
+    return _RooFit._LineStyle(_resolve_root_attribute(style, _style_map, _resolved_style_map))
 
 
 @cpp_signature("RooFit::FillStyle(Style_t style) ;")
 def FillStyle(style):
     # Redefinition of `FillStyle` for matplotlib conventions and string arguments.
-    from cppyy.gbl import RooFit
-
-    return RooFit._FillStyle(_string_to_root_attribute(style, {}))
+    return _RooFit._FillStyle(_resolve_root_attribute(style, {}, _resolved_attribute_map))
 
 
 @cpp_signature("RooFit::MarkerStyle(Style_t style) ;")
 def MarkerStyle(style):
     # Redefinition of `MarkerStyle` for matplotlib conventions and string arguments.
-    from cppyy.gbl import RooFit
+    return _RooFit._MarkerStyle(_resolve_root_attribute(style, {}, _resolved_attribute_map))
 
-    return RooFit._MarkerStyle(_string_to_root_attribute(style, {}))
+
+# The values of the RooAbsData::ErrorType enum by name, filled on the first
+# call to DataError() with a string argument.
+_error_types = {}
 
 
 @cpp_signature("RooFit::DataError(Int_t) ;")
@@ -299,23 +314,23 @@ def DataError(etype):
     """
     # Redefinition of `DataError` to also accept `str` or `NoneType` to get the
     # corresponding enum values from RooAbsData.DataError.
-    from cppyy.gbl import RooFit
-
     # One of the possible enum values is "None", and we want the user to be
     # able to pass None also as a NoneType for convenience.
     if etype is None:
         etype = "None"
 
     if isinstance(etype, str):
-        try:
+        if not _error_types:
             import ROOT
-            etype = getattr(ROOT.RooAbsData.ErrorType, etype)
-        except AttributeError as error:
+
+            for name in ("Poisson", "SumW2", "Auto", "Expected", "None"):
+                _error_types[name] = getattr(ROOT.RooAbsData.ErrorType, name)
+        try:
+            etype = _error_types[etype]
+        except KeyError as error:
             raise ValueError(
                 'Unsupported error type type passed to DataError().'
                 + ' Supported decay types are : "Poisson", "SumW2", "Auto", "Expected", and None.'
             )
-        except Exception as exception:
-            raise exception
 
-    return RooFit._DataError(etype)
+    return _RooFit._DataError(etype)
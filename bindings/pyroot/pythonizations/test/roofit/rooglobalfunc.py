@@ -28,6 +28,56 @@ class TestRooGlobalFunc(unittest.TestCase):
         # Check that postfix operations applied to ROOT color codes work
         self.assertEqual(code(ROOT.kRed+1), code("kRed+1"))
 
+        # Check that the color can also be passed as a keyword argument
+        self.assertEqual(code(ROOT.kRed), ROOT.RooFit.LineColor(color="r").getInt(0))
+
+        # Check that repeated calls with the same string give the same result
+        self.assertEqual(code("kRed+1"), code("kRed+1"))
+        self.assertEqual(code("r"), code("r"))
+
+        # Check that general expressions are evaluated again on every call
+        old_color = ROOT.gStyle.GetHistLineColor()
+        try:
+            ROOT.gStyle.SetHistLineColor(ROOT.kRed)
+            self.assertEqual(code("gStyle.GetHistLineColor()"), code(ROOT.kRed))
+            ROOT.gStyle.SetHistLineColor(ROOT.kBlue)
+            self.assertEqual(code("gStyle.GetHistLineColor()"), code(ROOT.kBlue))
+        finally:
+            ROOT.gStyle.SetHistLineColor(old_color)
+
+    def test_style_codes(self):
+        """Test that the style code pythonizations in the functions like
+        RooFit.LineStyle are working as they should.
+        """
+
+        def code(style):
+            return ROOT.RooFit.LineStyle(style).getInt(0)
+
+        self.assertEqual(code(ROOT.kDashed), code("kDashed"))
+        self.assertEqual(code(ROOT.kDashed), code("--"))
+        self.assertEqual(code(ROOT.kDashed), ROOT.RooFit.LineStyle(style="--").getInt(0))
+
+        # Check that repeated calls with the same string give the same result
+        self.assertEqual(code("kDashed"), code("kDashed"))
+        self.assertEqual(code("--"), code("--"))
+
+    def test_slice_dict(self):
+        """Test that RooFit.Slice converts a dict of categories and state
+        labels to a std::map, giving one slice per dict entry.
+        """
+
+        cat_a = ROOT.RooCategory("cat_a", "cat_a", {"a1": 1, "a2": 2})
+        cat_b = ROOT.RooCategory("cat_b", "cat_b", {"b1": 1, "b2": 2})
+
+        def n_slices(slices):
+            return ROOT.RooFit.Slice(slices).subArgs().GetSize()
+
+        slices = {cat_a: "a1"}
+        self.assertEqual(n_slices(slices), 1)
+
+        slices[cat_b] = "b2"
+        self.assertEqual(n_slices(slices), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
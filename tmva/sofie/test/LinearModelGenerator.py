@@ -78,14 +78,8 @@ def main():
 
    verbose = args.v
 
-   xinput  = torch.zeros([])
-   for ib in range(0,bsize):
-      xa = torch.ones([1,d]) * (ib+1)
-      #concatenate tensors
-      if (ib == 0) :
-         xinput = xa
-      else :
-         xinput = torch.cat((xinput,xa),0)
+   # row ib of the input is filled with the value ib+1
+   xinput = torch.arange(1, bsize + 1, dtype=torch.float32).view(bsize, 1).repeat(1, d)
 
    xinput_test = xinput
    #in case of batch normalization generate different data for training
@@ -135,18 +129,19 @@ def main():
 
    #set model in evaluation format 
    model.eval() 
-   y = model.forward(xinput_test)
+   #no gradients are needed for computing the reference output
+   with torch.no_grad():
+      y = model.forward(xinput_test)
    
    print("output data : shape, ",y.shape)
    print(y)
 
-   outSize = y.nelement()
-   yvec = y.reshape([outSize])
-   
+   #flatten the output into a numpy array in a single pass
+   yvec = y.cpu().numpy().ravel()
 
-   f = open(name + ".out", "w")
-   for i in range(0,outSize):
-        f.write(str(float(yvec[i]))+" ")
+   #convert the output values in one go and write them with a single call
+   with open(name + ".out", "w") as f:
+        f.write(" ".join(map(str, yvec.tolist())))
 
 
 